@@ -29,6 +29,12 @@ if TYPE_CHECKING:
 
 from . import FileMetadata
 
+# Read the response in 64 KiB pieces and coalesce them into 1 MiB writes, so a
+# multi-megabyte archive zip costs a handful of write syscalls instead of one
+# per 8 KiB network chunk.
+_READ_CHUNK_SIZE = 1 << 16
+_WRITE_BUFFER_SIZE = 1 << 20
+
 
 class BinanceAdapter:
     """Adapter for Binance data.binance.vision S3 archive.
@@ -155,8 +161,8 @@ class BinanceAdapter:
             response.raise_for_status()
 
             # Write response to file in chunks
-            with open(destination_path, "wb") as f:
-                async for chunk in response.content.iter_chunked(8192):
+            with open(destination_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+                async for chunk in response.content.iter_chunked(_READ_CHUNK_SIZE):
                     f.write(chunk)
 
     def parse_symbol(self, raw_symbol: str) -> dict | None:
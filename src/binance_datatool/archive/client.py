@@ -11,9 +11,18 @@ from urllib.parse import urlencode
 import aiohttp
 import xmltodict
 from loguru import logger
-from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential
-
-from binance_datatool.common import S3_HTTP_TIMEOUT_SECONDS, S3_LISTING_PREFIX
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from binance_datatool.common import (
+    S3_HTTP_TIMEOUT_SECONDS,
+    S3_LISTING_CONCURRENCY,
+    S3_LISTING_PREFIX,
+)
 from binance_datatool.common.progress import ProgressEvent, make_reporter
 
 if TYPE_CHECKING:
@@ -125,6 +134,7 @@ class ArchiveClient:
         *,
         timeout_seconds: int | float = S3_HTTP_TIMEOUT_SECONDS,
         trust_env: bool = True,
+        max_concurrency: int = S3_LISTING_CONCURRENCY,
     ) -> None:
         """Initialize the archive client.
 
@@ -133,9 +143,12 @@ class ArchiveClient:
             trust_env: When ``True``, the underlying ``aiohttp`` session reads
                 proxy configuration from standard environment variables
                 (``http_proxy``, ``https_proxy``, ``no_proxy``).
+            max_concurrency: Maximum number of symbol listings that
+                :meth:`list_symbol_files_batch` keeps in flight at once.
         """
         self.timeout_seconds = timeout_seconds
         self.trust_env = trust_env
+        self.max_concurrency = max_concurrency
 
     def _create_session(self) -> aiohttp.ClientSession:
         """Create an HTTP session for archive requests."""
@@ -146,7 +159,9 @@ class ArchiveClient:
         """Fetch and parse a single S3 XML listing page."""
         async for attempt in AsyncRetrying(
             stop=stop_after_attempt(5),
-            wait=wait_exponential(multiplier=1, min=1, max=8),
+            # Full jitter: concurrent listings that fail together (e.g. a
+            # throttled batch) spread their retries instead of retrying in lockstep.
+            wait=wait_random_exponential(multiplier=1, max=8),
             retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
             reraise=True,
         ):
@@ -321,6 +336,9 @@ class ArchiveClient:
     ) -> dict[str, SymbolListingResult]:
         """List files for multiple symbols concurrently via a shared session.
 
+        At most ``max_concurrency`` listings are in flight at any time so
+        large symbol sets do not flood the archive endpoint.
+
         Args:
             trade_type: Market segment (spot, um, cm).
             data_freq: Partition frequency (daily, monthly).
@@ -339,33 +357,40 @@ class ArchiveClient:
         if not symbols:
             return {}
 
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
         async with self._create_session() as session:
 
             async def _one(symbol: str) -> tuple[str, list[ArchiveFile], str | None]:
                 try:
-                    files = await self.list_symbol_files(
-                        trade_type,
-                        data_freq,
-                        data_type,
-                        symbol,
-                        interval,
-                        session=session,
-                    )
+                    async with semaphore:
+                        files = await self.list_symbol_files(
+                            trade_type,
+                            data_freq,
+                            data_type,
+                            symbol,
+                            interval,
+                            session=session,
+                        )
                     return symbol, files, None
                 except Exception as exc:
                     return symbol, [], str(exc)
 
-            coroutines = [_one(symbol) for symbol in symbols]
             outcomes: dict[str, SymbolListingResult] = {}
-            with make_reporter(
-                progress_bar,
-                total=len(symbols),
-                description="List files",
-            ) as reporter:
-                for coroutine in asyncio.as_completed(coroutines):
-                    symbol, files, error = await coroutine
-                    outcomes[symbol] = (files, error)
-                    reporter.tick(ProgressEvent(name=symbol, ok=error is None))
+            # The TaskGroup guarantees that cancellation (the only exception
+            # that escapes _one) cancels every sibling listing before the
+            # shared session closes, instead of leaving them orphaned.
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [task_group.create_task(_one(symbol)) for symbol in symbols]
+                with make_reporter(
+                    progress_bar,
+                    total=len(symbols),
+                    description="List files",
+                ) as reporter:
+                    for next_done in asyncio.as_completed(tasks):
+                        symbol, files, error = await next_done
+                        outcomes[symbol] = (files, error)
+                        reporter.tick(ProgressEvent(name=symbol, ok=error is None))
 
         return {symbol: outcomes[symbol] for symbol in symbols}
 
@@ -766,8 +766,10 @@ def health_command(
         if health.corrupted_files:
             typer.echo(f"  Corrupted: {health.corrupted_files[:5]}", err=True)
 
+    healthy_symbols = report.healthy_symbols
+    total_symbols = report.total_symbols
     typer.echo(
-        f"Summary: {report.healthy_symbols}/{report.total_symbols} healthy, "
+        f"Summary: {healthy_symbols}/{total_symbols} healthy, "
         f"{report.total_missing_dates} missing dates, "
         f"{report.total_corrupted} corrupted files",
         err=True,
@@ -775,7 +777,7 @@ def health_command(
     if report.errors:
         for err in report.errors:
             typer.echo(f"Error: {err}", err=True)
-    if report.total_symbols > 0 and report.healthy_symbols < report.total_symbols:
+    if total_symbols > 0 and healthy_symbols < total_symbols:
         raise typer.Exit(code=2)
 
 
@@ -2,8 +2,11 @@
 
 from binance_datatool.common.constants import (
     QUOTE_ASSETS,
+    REST_CLIENT_CONCURRENCY,
+    REST_FILL_CONCURRENCY,
     S3_DOWNLOAD_PREFIX,
     S3_HTTP_TIMEOUT_SECONDS,
+    S3_LISTING_CONCURRENCY,
     S3_LISTING_PREFIX,
 )
 from binance_datatool.common.enums import ContractType, DataFrequency, DataType, TradeType
@@ -39,8 +42,11 @@ __all__ = [
     "DataType",
     "KlineData",
     "QUOTE_ASSETS",
+    "REST_CLIENT_CONCURRENCY",
+    "REST_FILL_CONCURRENCY",
     "S3_DOWNLOAD_PREFIX",
     "S3_HTTP_TIMEOUT_SECONDS",
+    "S3_LISTING_CONCURRENCY",
     "S3_LISTING_PREFIX",
     "SilverFundingRate",
     "SilverKline",
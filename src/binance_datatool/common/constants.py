@@ -9,6 +9,18 @@ S3_DOWNLOAD_PREFIX = "https://data.binance.vision"
 # Default timeout in seconds for a single HTTP request to the S3 listing endpoint.
 S3_HTTP_TIMEOUT_SECONDS = 15
 
+# Default cap on concurrent S3 listing requests issued by a batch listing.
+S3_LISTING_CONCURRENCY = 32
+
+# Process-wide cap on in-flight requests per Binance REST client. Clients are
+# shared across threads (see shared_rest_client), so this is what keeps total
+# concurrency below the SDK session's 10-connection HTTP pool.
+REST_CLIENT_CONCURRENCY = 8
+
+# Default cap on concurrent REST fetches within one gap fill. Several gap fills
+# can run at once (one per Prefect worker); REST_CLIENT_CONCURRENCY bounds their sum.
+REST_FILL_CONCURRENCY = 4
+
 # Quote assets observed in Binance spot and USD-M symbols.
 # Ordering is significant: longer suffixes must be matched before shorter ones.
 # fmt: off
@@ -65,12 +65,17 @@ class DataType(StrEnum):
             an interval directory segment (e.g. ``"1m"``, ``"1h"``);
             ``False`` otherwise.
         """
-        return self in {
-            DataType.klines,
-            DataType.index_price_klines,
-            DataType.mark_price_klines,
-            DataType.premium_index_klines,
-        }
+        return self in _INTERVAL_LAYER_TYPES
+
+
+_INTERVAL_LAYER_TYPES: frozenset[DataType] = frozenset(
+    {
+        DataType.klines,
+        DataType.index_price_klines,
+        DataType.mark_price_klines,
+        DataType.premium_index_klines,
+    }
+)
 
 
 class ContractType(StrEnum):
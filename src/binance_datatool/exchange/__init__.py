@@ -7,6 +7,7 @@ from binance_datatool.exchange.binance_rest import (
     BinanceRestClient,  # backward compatibility alias
     BinanceSpotRestClient,
     BinanceUmRestClient,
+    shared_rest_client,
 )
 from binance_datatool.exchange.binance_ws import (
     BinanceCmWsClient,
@@ -24,6 +25,7 @@ __all__ = [
     "BinanceUmRestClient",
     "BinanceCmRestClient",
     "BinanceRestClient",  # backward compatibility
+    "shared_rest_client",
     "BinanceSpotWsClient",
     "BinanceUmWsClient",
     "BinanceCmWsClient",
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import threading
+from typing import Any
+
 from binance_common.configuration import ConfigurationRestAPI
 from binance_common.constants import (
     DERIVATIVES_TRADING_COIN_FUTURES_REST_API_PROD_URL,
@@ -17,11 +22,17 @@ from binance_sdk_derivatives_trading_usds_futures.derivatives_trading_usds_futur
 )
 from binance_sdk_spot.spot import Spot
 
+from binance_datatool.common.constants import REST_CLIENT_CONCURRENCY
 from binance_datatool.common.enums import TradeType
 from binance_datatool.common.intervals import VALID_INTERVALS
 from binance_datatool.common.types import KlineData
 
-__all__ = ["BinanceSpotRestClient", "BinanceUmRestClient", "BinanceCmRestClient"]
+__all__ = [
+    "BinanceSpotRestClient",
+    "BinanceUmRestClient",
+    "BinanceCmRestClient",
+    "shared_rest_client",
+]
 
 _KLINES_LIMIT = 1000
 
@@ -76,6 +87,7 @@ class _BinanceRestClientBase:
             timeout=int(timeout_seconds * 1000),
         )
         self._client = _SDK_CLASSES[trade_type](config_rest_api=config)
+        self._slots = threading.BoundedSemaphore(REST_CLIENT_CONCURRENCY)
 
     @property
     def exchange_id(self) -> str:
@@ -85,6 +97,23 @@ class _BinanceRestClientBase:
     def trade_type(self) -> TradeType:
         return self._trade_type
 
+    async def _call(self, method_name: str, params: dict) -> Any:
+        """Invoke a blocking SDK REST method in a worker thread.
+
+        The SDK performs synchronous HTTP; running it via
+        :func:`asyncio.to_thread` keeps the event loop free for other
+        coroutines while a page is in flight. The request is gated by the
+        client's semaphore, which every thread and event loop sharing this
+        client goes through.
+        """
+        method = getattr(self._client.rest_api, method_name)
+        response = await asyncio.to_thread(self._call_bounded, method, params)
+        return response.data()
+
+    def _call_bounded(self, method: Any, params: dict) -> Any:
+        with self._slots:
+            return method(**params)
+
     async def _fetch_page(
         self,
         symbol: str,
@@ -93,10 +122,6 @@ class _BinanceRestClientBase:
         end_time: int | None,
         limit: int,
     ) -> list[KlineData]:
-        method_name = _REST_API_METHOD[self._trade_type]
-        rest_api = self._client.rest_api
-        method = getattr(rest_api, method_name)
-
         params: dict = {
             "symbol": symbol.upper(),
             "interval": interval,
@@ -107,8 +132,7 @@ class _BinanceRestClientBase:
         if end_time is not None:
             params["end_time"] = end_time
 
-        response = method(**params)
-        data = response.data()
+        data = await self._call(_REST_API_METHOD[self._trade_type], params)
 
         return [KlineData.from_binance_api(kline) for kline in data]
 
@@ -119,10 +143,6 @@ class _BinanceRestClientBase:
         until: int | None = None,
         limit: int | None = None,
     ) -> list:
-        method_name = _AGG_TRADES_METHOD[self._trade_type]
-        rest_api = self._client.rest_api
-        method = getattr(rest_api, method_name)
-
         params: dict = {"symbol": symbol.upper()}
         if since is not None:
             params["start_time"] = since
@@ -131,8 +151,7 @@ class _BinanceRestClientBase:
         if limit is not None:
             params["limit"] = limit
 
-        response = method(**params)
-        return response.data()
+        return await self._call(_AGG_TRADES_METHOD[self._trade_type], params)
 
     async def fetch_funding_rate(
         self,
@@ -144,8 +163,6 @@ class _BinanceRestClientBase:
         method_name = _FUNDING_RATE_METHOD.get(self._trade_type)
         if method_name is None:
             raise NotImplementedError(f"Funding rate not supported for {self._trade_type}")
-        rest_api = self._client.rest_api
-        method = getattr(rest_api, method_name)
 
         params: dict = {"symbol": symbol.upper()}
         if since is not None:
@@ -155,8 +172,7 @@ class _BinanceRestClientBase:
         if limit is not None:
             params["limit"] = limit
 
-        response = method(**params)
-        return response.data()
+        return await self._call(method_name, params)
 
     async def close(self) -> None:
         return
@@ -183,6 +199,7 @@ class BinanceSpotRestClient(_BinanceRestClientBase):
             timeout=int(timeout_seconds * 1000),
         )
         self._client = Spot(config_rest_api=config)
+        self._slots = threading.BoundedSemaphore(REST_CLIENT_CONCURRENCY)
 
     async def fetch_ohlcv(
         self,
@@ -340,3 +357,34 @@ class BinanceCmRestClient(_BinanceRestClientBase):
 
 
 BinanceRestClient = BinanceSpotRestClient
+
+_REST_CLIENT_CLASSES: dict[TradeType, type[_BinanceRestClientBase]] = {
+    TradeType.spot: BinanceSpotRestClient,
+    TradeType.um: BinanceUmRestClient,
+    TradeType.cm: BinanceCmRestClient,
+}
+
+
+@functools.cache
+def shared_rest_client(trade_type: TradeType) -> _BinanceRestClientBase:
+    """Return the process-wide REST client for ``trade_type``.
+
+    Built lazily on first use and reused afterwards, so repeated flow runs
+    and metadata refreshes share one SDK client (and its HTTP session) per
+    market instead of constructing a new one per call.
+
+    Sharing across Prefect worker threads and :func:`asyncio.to_thread` calls
+    is safe: the SDK builds headers and params per request and only calls
+    ``requests.Session.request`` on the shared session, whose urllib3 pool is
+    thread-safe. The client is unauthenticated, so there is no signing or
+    cookie state to race on. The pool keeps 10 connections per host, and each
+    client caps its in-flight requests at ``REST_CLIENT_CONCURRENCY`` so that
+    concurrent callers never outgrow it.
+
+    Args:
+        trade_type: Market segment (spot, um, cm).
+
+    Returns:
+        The cached REST client for the market segment.
+    """
+    return _REST_CLIENT_CLASSES[trade_type]()
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import importlib
+import logging
 
 from binance_datatool.common.enums import TradeType
-from binance_datatool.common.intervals import VALID_INTERVALS
+from binance_datatool.common.intervals import VALID_INTERVALS, interval_to_ms
 from binance_datatool.common.types import KlineData
 
 __all__ = ["CCXTProExchangeClient"]
@@ -124,9 +125,7 @@ class CCXTProExchangeClient:
                     )
             except Exception as e:
                 # CCXT Pro handles reconnection internally, but we log the error
-                import logging
-
-                logging.warning(f"WebSocket error: {e}. Continuing...")
+                logging.warning("WebSocket error: %s. Continuing...", e)
                 await asyncio.sleep(1)
 
     async def close(self) -> None:
@@ -135,8 +134,6 @@ class CCXTProExchangeClient:
 
     def _interval_to_ms(self, interval: str) -> int:
         """Convert interval string to milliseconds."""
-        from binance_datatool.common.intervals import interval_to_ms
-
         return interval_to_ms(interval)
 
     def _to_ccxt_symbol(self, symbol: str) -> str:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from binance_datatool.common.intervals import VALID_INTERVALS
+from binance_datatool.common.intervals import VALID_INTERVALS, interval_to_ms
 from binance_datatool.common.types import KlineData
 
 if TYPE_CHECKING:
@@ -174,6 +174,4 @@ class CCXTExchangeClient:
 
     def _interval_to_ms(self, interval: str) -> int:
         """Convert interval string to milliseconds."""
-        from binance_datatool.common.intervals import interval_to_ms
-
         return interval_to_ms(interval)
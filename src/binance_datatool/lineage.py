@@ -39,6 +39,8 @@ from typing import TYPE_CHECKING
 from loguru import logger
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     import polars as pl
 
 
@@ -65,7 +67,7 @@ class LineageEventType(StrEnum):
     BACKTESTED = "backtested"  # Data used in backtesting
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class LineageEvent:
     """A single lineage event.
 
@@ -141,8 +143,17 @@ class LineageTracker:
         Returns:
             List of LineageEvents matching all filters.
         """
-        result = []
+        return list(self._iter_matching(source, symbol, date, event_type, date_range))
 
+    def _iter_matching(
+        self,
+        source: str | None = None,
+        symbol: str | None = None,
+        date: str | None = None,
+        event_type: LineageEventType | None = None,
+        date_range: tuple[datetime, datetime] | None = None,
+    ) -> Iterator[LineageEvent]:
+        """Yield events matching all filters without materializing a list."""
         for event in self._events:
             # Apply filters
             if source and event.source != source:
@@ -158,9 +169,7 @@ class LineageTracker:
                 if not (start <= event.timestamp <= end):
                     continue
 
-            result.append(event)
-
-        return result
+            yield event
 
     def get_latest(
         self,
@@ -176,10 +185,11 @@ class LineageTracker:
         Returns:
             Most recent LineageEvent, or None if no matches.
         """
-        matches = self.query(source=source, symbol=symbol)
-        if not matches:
-            return None
-        return max(matches, key=lambda e: e.timestamp)
+        return max(
+            self._iter_matching(source=source, symbol=symbol),
+            key=lambda e: e.timestamp,
+            default=None,
+        )
 
     def count(
         self,
@@ -197,7 +207,9 @@ class LineageTracker:
         Returns:
             Count of matching events.
         """
-        return len(self.query(source=source, symbol=symbol, event_type=event_type))
+        return sum(
+            1 for _ in self._iter_matching(source=source, symbol=symbol, event_type=event_type)
+        )
 
     def clear(self) -> None:
         """Clear all lineage events."""
@@ -283,20 +283,15 @@ class DuckLakeCatalog:
             cols = self.TABLE_DEFS.get(table_name, "")
             table_cols = [c.split()[0] for c in cols.split(",")]
             # Build select list: existing columns + NULL for missing ones
-            select_parts = []
-            for c in table_cols:
-                if c in df.columns:
-                    select_parts.append(c)
-                else:
-                    select_parts.append(f"NULL AS {c}")
-            # Dedup: delete existing rows for symbol/date before re-inserting
+            df_cols = set(df.columns)
+            select_parts = [c if c in df_cols else f"NULL AS {c}" for c in table_cols]
+            # Dedup: delete existing rows for symbol/date before re-inserting,
+            # as one semi-join DELETE rather than one statement per pair
             if "symbol" in df.columns and "ts_date" in df.columns:
-                for sym, dt in df.select(["symbol", "ts_date"]).unique().rows():
-                    con.execute(
-                        f"DELETE FROM {table_name} WHERE symbol = ? AND ts_date = ?",
-                        [sym, str(dt)],
-                    )
-            df = df.with_columns(pl.lit(None).alias("_null_placeholder"))
+                con.execute(
+                    f"DELETE FROM {table_name} AS t WHERE EXISTS ("
+                    "SELECT 1 FROM df WHERE df.symbol = t.symbol AND df.ts_date = t.ts_date)"
+                )
             con.execute(f"INSERT INTO {table_name} SELECT {', '.join(select_parts)} FROM df")
             ingested = len(df)
         except Exception as e:
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import hashlib
+import os
 import re
+from collections import deque
 from datetime import UTC, datetime, timedelta
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from loguru import logger
 
+from binance_datatool.common import REST_FILL_CONCURRENCY
 from binance_datatool.lineage import LineageEvent, LineageEventType
 
 if TYPE_CHECKING:
@@ -36,44 +41,45 @@ def _archive_path(
     return path
 
 
+_CSV_HEADERS: dict[str, list[str]] = {
+    "klines": [
+        "open_time",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "close_time",
+        "quote_volume",
+        "count",
+        "taker_buy_volume",
+        "taker_buy_quote_volume",
+        "ignore",
+    ],
+    "aggTrades": [
+        "agg_trade_id",
+        "price",
+        "quantity",
+        "first_trade_id",
+        "last_trade_id",
+        "transact_time",
+        "is_buyer_maker",
+    ],
+    "fundingRate": [
+        "symbol",
+        "funding_time",
+        "funding_rate",
+        "mark_price",
+    ],
+}
+
+
 def _csv_header(data_type: str) -> list[str]:
     """Return CSV header for the given data type.
 
     Matches Binance archive CSV format.
     """
-    if data_type == "klines":
-        return [
-            "open_time",
-            "open",
-            "high",
-            "low",
-            "close",
-            "volume",
-            "close_time",
-            "quote_volume",
-            "count",
-            "taker_buy_volume",
-            "taker_buy_quote_volume",
-            "ignore",
-        ]
-    if data_type == "aggTrades":
-        return [
-            "agg_trade_id",
-            "price",
-            "quantity",
-            "first_trade_id",
-            "last_trade_id",
-            "transact_time",
-            "is_buyer_maker",
-        ]
-    if data_type == "fundingRate":
-        return [
-            "symbol",
-            "funding_time",
-            "funding_rate",
-            "mark_price",
-        ]
-    return []
+    return list(_CSV_HEADERS.get(data_type, ()))
 
 
 def _kline_to_row(kline: KlineData) -> list[str]:
@@ -142,15 +148,15 @@ def _scan_existing_dates(symbol_dir: Path) -> set[str]:
     dates: set[str] = set()
     if not symbol_dir.exists():
         return dates
-    for entry in symbol_dir.iterdir():
-        if entry.is_dir() and entry.name == "_filled":
-            continue
-        if entry.is_dir():
-            dates.update(_scan_existing_dates(entry))
-            continue
-        m = _DATE_PATTERN.match(entry.name)
-        if m:
-            dates.add(m.group(1))
+    with os.scandir(symbol_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                if entry.name != "_filled":
+                    dates.update(_scan_existing_dates(Path(entry.path)))
+                continue
+            m = _DATE_PATTERN.match(entry.name)
+            if m:
+                dates.add(m.group(1))
     return dates
 
 
@@ -226,6 +232,7 @@ class GapFillWorkflow:
         interval: str | None = None,
         tracker: LineageTracker | None = None,
         lookback_days: int = 30,
+        max_concurrency: int = REST_FILL_CONCURRENCY,
     ) -> None:
         self._client = exchange_client
         self._archive_home = Path(archive_home)
@@ -234,6 +241,7 @@ class GapFillWorkflow:
         self._interval = interval
         self._tracker = tracker
         self._lookback_days = lookback_days
+        self._max_concurrency = max_concurrency
 
     def detect_gaps(
         self,
@@ -322,39 +330,62 @@ class GapFillWorkflow:
             logger.info("No gaps specified (use detect_gaps or start/end time)")
             return result
 
-        for symbol, s_time, e_time in gaps:
+        async def _fetch_one(symbol: str, s_time: int, e_time: int) -> tuple[list, str | None]:
             logger.info("Filling gap for {} {} [{}, {}]", symbol, self._data_type, s_time, e_time)
             try:
-                data = await self._fetch_data(symbol, s_time, e_time)
-                if not data:
-                    logger.info("No data returned for {}", symbol)
-                    continue
-                paths = self._save_filled(trade_type, symbol, data)
-                result.filled.extend(paths)
-                row_count = len(data)
-                logger.info("Filled {} rows for {} -> {}", row_count, symbol, paths)
-
-                if self._tracker:
-                    event = LineageEvent(
-                        source=f"binance_{trade_type.value}",
-                        symbol=symbol,
-                        event_type=LineageEventType.FILLED,
-                        timestamp=datetime.now(UTC),
-                        message=f"Gap filled: {self._data_type} from REST API",
-                        metadata={
-                            "data_type": self._data_type,
-                            "interval": self._interval,
-                            "start_ms": s_time,
-                            "end_ms": e_time,
-                            "row_count": row_count,
-                            "files": [str(p) for p in paths],
-                        },
-                    )
-                    self._tracker.record(event)
-                    result.lineage_events.append(event)
+                return await self._fetch_data(symbol, s_time, e_time), None
             except Exception as e:
-                logger.error("Failed to fill {}: {}", symbol, e)
-                result.failed.append((symbol, str(e)))
+                return [], str(e)
+
+        # Gaps are independent REST ranges: fetch them concurrently, but
+        # persist them in gap order so per-symbol files stay ordered. At most
+        # max_concurrency gaps are scheduled but not yet persisted, which caps
+        # both this run's in-flight requests (the REST client bounds the total
+        # across runs) and the payloads held while an earlier gap is slow.
+        remaining = iter(gaps)
+        async with asyncio.TaskGroup() as task_group:
+            pending: deque = deque()
+            while True:
+                for gap in islice(remaining, self._max_concurrency - len(pending)):
+                    pending.append((gap, task_group.create_task(_fetch_one(*gap))))
+                if not pending:
+                    break
+                (symbol, s_time, e_time), task = pending.popleft()
+                data, error = await task
+                if error is not None:
+                    logger.error("Failed to fill {}: {}", symbol, error)
+                    result.failed.append((symbol, error))
+                    continue
+                try:
+                    if not data:
+                        logger.info("No data returned for {}", symbol)
+                        continue
+                    paths = self._save_filled(trade_type, symbol, data)
+                    result.filled.extend(paths)
+                    row_count = len(data)
+                    logger.info("Filled {} rows for {} -> {}", row_count, symbol, paths)
+
+                    if self._tracker:
+                        event = LineageEvent(
+                            source=f"binance_{trade_type.value}",
+                            symbol=symbol,
+                            event_type=LineageEventType.FILLED,
+                            timestamp=datetime.now(UTC),
+                            message=f"Gap filled: {self._data_type} from REST API",
+                            metadata={
+                                "data_type": self._data_type,
+                                "interval": self._interval,
+                                "start_ms": s_time,
+                                "end_ms": e_time,
+                                "row_count": row_count,
+                                "files": [str(p) for p in paths],
+                            },
+                        )
+                        self._tracker.record(event)
+                        result.lineage_events.append(event)
+                except Exception as e:
+                    logger.error("Failed to fill {}: {}", symbol, e)
+                    result.failed.append((symbol, str(e)))
 
         return result
 
@@ -20,7 +20,7 @@ if TYPE_CHECKING:
 _DATE_PATTERN = re.compile(r".*?-(\d{4}-\d{2}-\d{2})(?:\.zip|\.csv|\.filled\.csv)")
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolHealth:
     """Health status for a single symbol/data_type/interval."""
 
@@ -48,7 +48,7 @@ class SymbolHealth:
         return round(self.date_count / total_expected * 100, 1)
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthReport:
     """Aggregate health report for a set of symbols."""
 
@@ -220,7 +220,7 @@ def _check_file_hash(file_path: Path, checksum_path: Path) -> bool:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class AnomalyReport:
     """Anomalies detected in DuckLake data."""
 
@@ -280,30 +280,25 @@ def check_ducklake_anomalies(
     if not _table_exists(con, tn):
         return report
 
-    # Null/zero price check (only for columns that exist in this table)
-    schema_cols = [
+    # Null/zero price and zero volume checks (only for columns that exist in
+    # this table), fused into one scan with a filtered count per column
+    schema_cols = {
         r[0]
         for r in con.execute(
             "SELECT column_name FROM information_schema.columns WHERE table_name = ?",
             [tn],
         ).fetchall()
-    ]
-    for col in ("open", "high", "low", "close"):
-        if col not in schema_cols:
-            continue
-        nulls = con.execute(
-            f"SELECT COUNT(*) FROM {tn} {_where()} AND ({col} IS NULL OR {col} = 0)",
-            _params(),
-        ).fetchone()[0]
-        report.null_prices += nulls
-
-    # Zero volume check
-    if "volume" in schema_cols:
-        zeros = con.execute(
-            f"SELECT COUNT(*) FROM {tn} {_where()} AND (volume IS NULL OR volume = 0)",
-            _params(),
-        ).fetchone()[0]
-        report.zero_volumes = zeros
+    }
+    price_cols = [col for col in ("open", "high", "low", "close") if col in schema_cols]
+    count_cols = price_cols + (["volume"] if "volume" in schema_cols else [])
+    if count_cols:
+        filtered = ", ".join(
+            f"COUNT(*) FILTER (WHERE {col} IS NULL OR {col} = 0)" for col in count_cols
+        )
+        counts = con.execute(f"SELECT {filtered} FROM {tn} {_where()}", _params()).fetchone()
+        report.null_prices = sum(counts[: len(price_cols)])
+        if "volume" in schema_cols:
+            report.zero_volumes = counts[-1]
 
     # Duplicate timestamps
     dups = con.execute(
@@ -319,27 +314,30 @@ def check_ducklake_anomalies(
     ).fetchall()
     if len(dates) > 1:
         date_strs = [str(d[0]) for d in dates]
+        present = set(date_strs)
         try:
             expected = _date_range(date_strs[0], date_strs[-1])
-            report.date_gaps = [d for d in expected if d not in date_strs]
+            report.date_gaps = [d for d in expected if d not in present]
         except ValueError:
             logger.warning(
                 "Date range computation failed for {}/{} — bad timestamps in data", tn, symbol
             )
 
-    # Price outliers (Z-score > threshold)
-    try:
-        outliers = con.execute(
-            f"SELECT COUNT(*) FROM {tn}, (SELECT AVG(close) AS avg_c, STDDEV(close) AS std_c FROM {tn} {_where()}) stats {_where()} AND ABS((close - avg_c) / NULLIF(std_c, 0)) > ?",
-            _params() + _params() + [outlier_std],
-        ).fetchone()[0]
-        report.outlier_rows = outliers
-    except Exception:
-        logger.warning(
-            "Outlier query failed for {}/{} — STDDEV may be 0 or schema mismatch",
-            tn,
-            symbol,
-        )
+    # Price outliers (Z-score > threshold); trade and funding tables have no
+    # close column, so skip the query rather than let it fail on every run
+    if "close" in schema_cols:
+        try:
+            outliers = con.execute(
+                f"SELECT COUNT(*) FROM {tn}, (SELECT AVG(close) AS avg_c, STDDEV(close) AS std_c FROM {tn} {_where()}) stats {_where()} AND ABS((close - avg_c) / NULLIF(std_c, 0)) > ?",
+                _params() + _params() + [outlier_std],
+            ).fetchone()[0]
+            report.outlier_rows = outliers
+        except Exception:
+            logger.warning(
+                "Outlier query failed for {}/{} — STDDEV may be 0 or schema mismatch",
+                tn,
+                symbol,
+            )
 
     return report
 
@@ -9,13 +9,12 @@ from typing import TYPE_CHECKING
 import polars as pl
 from loguru import logger
 
-from binance_datatool.common import TradeType
 from binance_datatool.common.types import SymbolMetadata, VenueMetadata
 from binance_datatool.workflow.list_symbols import ArchiveListSymbolsWorkflow
 
 if TYPE_CHECKING:
     from binance_datatool.archive.client import ArchiveClient
-    from binance_datatool.common import DataFrequency, DataType
+    from binance_datatool.common import DataFrequency, DataType, TradeType
 
 
 class MetadataWorkflow:
@@ -123,23 +122,12 @@ class MetadataWorkflow:
         symbols: list[str] | None = None,
     ) -> list[SymbolMetadata]:
         """Fetch symbol metadata from the Binance REST API via SDK."""
-        from binance_datatool.exchange import (
-            BinanceCmRestClient,
-            BinanceSpotRestClient,
-            BinanceUmRestClient,
-        )
+        from binance_datatool.exchange import shared_rest_client
 
         now = int(time.time() * 1000)
         result: list[SymbolMetadata] = []
 
-        match trade_type:
-            case TradeType.spot:
-                client = BinanceSpotRestClient()
-            case TradeType.um:
-                client = BinanceUmRestClient()
-            case TradeType.cm:
-                client = BinanceCmRestClient()
-
+        client = shared_rest_client(trade_type)
         api = client._client.rest_api
         exchange_info = getattr(api, "exchange_info", None) or getattr(
             api, "exchange_information", None
@@ -152,10 +140,11 @@ class MetadataWorkflow:
 
         # Binance SDK returns exchange_info with list of symbols
         symbol_list = getattr(data, "symbols", []) if not isinstance(data, list) else data
+        wanted = set(symbols) if symbols else None
 
         for s in symbol_list:
             sym_name = s.get("symbol", "") if isinstance(s, dict) else str(s)
-            if symbols and sym_name not in symbols:
+            if wanted is not None and sym_name not in wanted:
                 continue
             result.append(
                 SymbolMetadata(
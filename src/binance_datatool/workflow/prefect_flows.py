@@ -15,20 +15,19 @@ Design patterns (dataskew.io/blog/data-pipeline-design-patterns):
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from prefect import flow, task
+from prefect.futures import as_completed
 from prefect.task_runners import ThreadPoolTaskRunner
 
 from binance_datatool.archive.client import ArchiveClient
 from binance_datatool.common import DataFrequency, DataType, TradeType
 from binance_datatool.common.settings import settings
-from binance_datatool.exchange import (
-    BinanceCmRestClient,
-    BinanceSpotRestClient,
-    BinanceUmRestClient,
-)
+from binance_datatool.exchange import shared_rest_client
 from binance_datatool.lineage import LineageTracker
 from binance_datatool.workflow import (
     ArchiveDownloadWorkflow,
@@ -48,12 +47,6 @@ _DEFAULT_ARCHIVE_HOME = settings.archive_home
 _RETRY_CONFIG = {"retries": 3, "retry_delay_seconds": 10, "retry_jitter_factor": 0.2}
 _RETRY_LIGHT = {"retries": 2, "retry_delay_seconds": 10, "retry_jitter_factor": 0.2}
 
-_REST_CLIENTS = {
-    "spot": BinanceSpotRestClient,
-    "um": BinanceUmRestClient,
-    "cm": BinanceCmRestClient,
-}
-
 
 # ── Dead Letter Queue ───────────────────────────────────────────
 
@@ -63,8 +56,6 @@ _log = __import__("logging").getLogger(__name__)
 
 def _route_to_dlq(catalog: Path, symbol: str, data_type: str, errors: list[str]) -> None:
     """Route failed records to DuckLake DLQ table (Pattern 4)."""
-    from datetime import datetime
-
     import duckdb
 
     meta = catalog / "metadata.ducklake"
@@ -113,8 +104,6 @@ def download_archive(
     archive_home: Path | None = None,
 ) -> int:
     """Download archive data via ArchiveDownloadWorkflow."""
-    import asyncio
-
     home = archive_home or _DEFAULT_ARCHIVE_HOME
     dt = DataType(data_type)
     wf = ArchiveDownloadWorkflow(
@@ -164,9 +153,8 @@ def fill_gaps(
 ) -> list[tuple[str, int, int]]:
     """Detect and fill gaps via GapFillWorkflow."""
     home = archive_home or _DEFAULT_ARCHIVE_HOME
-    Client = _REST_CLIENTS.get(trade_type.value, BinanceSpotRestClient)
     workflow = GapFillWorkflow(
-        exchange_client=Client(),
+        exchange_client=shared_rest_client(trade_type),
         archive_home=home,
         symbols=[symbol],
         data_type=data_type,
@@ -187,8 +175,13 @@ def sink_silver(
     lookback_days: int = 30,
     archive_home: Path | None = None,
     catalog_path: Path | None = None,
+    symbols: list[str] | None = None,
 ) -> int:
-    """Sink to DuckLake via SinkWorkflow. Serialized via concurrency guard."""
+    """Sink to DuckLake via SinkWorkflow. Serialized via concurrency guard.
+
+    Pass ``symbols`` to sink several symbols in one DuckLake write instead of
+    just ``symbol``. Failed files are routed to the DLQ under their own symbol.
+    """
     from prefect.concurrency.sync import concurrency as _pcon
 
     with _pcon("ducklake-writer", occupy=1):
@@ -203,20 +196,29 @@ def sink_silver(
             duckdb_path=catalog / "catalog.duckdb",
             tracker=LineageTracker(),
         )
+        sink_symbols = symbols or [symbol]
         stats = workflow.transform(
             trade_type=TradeType(trade_type),
             data_type=dt,
-            symbols=[symbol],
+            symbols=sink_symbols,
             interval=interval,
         )
-        if stats.errors:
-            _route_to_dlq(catalog, symbol, data_type, stats.errors)
+        for failed_symbol, errors in stats.errors_by_symbol.items():
+            _route_to_dlq(catalog, failed_symbol, data_type, errors)
         return stats.row_count
 
 
 # ── Composed Flows ───────────────────────────────────────────────
 
 
+@dataclass(slots=True)
+class PreparedSymbol:
+    """Outcome of :func:`prepare_symbol` for one symbol."""
+
+    symbol: str
+    gaps: int
+
+
 @task
 def prepare_symbol(
     trade_type: str,
@@ -225,7 +227,7 @@ def prepare_symbol(
     interval: str = "1h",
     lookback_days: int = 30,
     archive_home: Path | None = None,
-) -> dict[str, Any]:
+) -> PreparedSymbol:
     """Prepare data: download → verify → fill_gaps (parallel-safe).
     Does NOT write to DuckDB — avoids concurrent write conflicts.
     """
@@ -235,14 +237,14 @@ def prepare_symbol(
     download_archive(trade_type, symbol, data_type, iv, lookback_days, home)
     verify_archive(trade_type, symbol, data_type, iv, home)
     gaps = fill_gaps(tt, symbol, data_type, iv, lookback_days, home)
-    return {"symbol": symbol, "gaps": len(gaps)}
+    return PreparedSymbol(symbol=symbol, gaps=len(gaps))
 
 
 @flow(
     name="Historical Data Pipeline",
     description="Metadata → download → verify → gap-fill → sink (parallel symbols)",
     log_prints=True,
-    task_runner=ThreadPoolTaskRunner(),
+    task_runner=ThreadPoolTaskRunner(max_workers=settings.prefect_max_workers),
 )
 def historical_pipeline(
     trade_type: str = "spot",
@@ -273,21 +275,26 @@ def historical_pipeline(
     )
 
     # Step 2: Sequential sink — DuckDB does not support concurrent writers.
-    # Prefect-native error isolation: zip symbols with futures so we always
-    # know which symbol failed, even when the task itself raises.
+    # Sink each symbol as soon as its own prepare finishes (as_completed), so
+    # writes overlap with downloads of slower symbols instead of waiting on
+    # the whole fan-out. Prefect-native error isolation: map futures back to
+    # symbols so we always know which symbol failed, even when the task raises.
     tt = TradeType(trade_type)
     iv = interval if data_type == "klines" else None
+    symbol_by_future = dict(zip(prep_futures, sym_list, strict=True))
     results: dict[str, Any] = {}
-    for sym, future in zip(sym_list, prep_futures, strict=True):
+    for future in as_completed(list(prep_futures)):
+        sym = symbol_by_future[future]
         meta = future.result(raise_on_failure=False)
         if future.state.is_completed():
             rows = sink_silver(tt, sym, data_type, iv, lookback_days, home, catalog)
-            results[sym] = {"gaps_filled": meta["gaps"], "rows_sunk": rows}
-            print(f"  {sym}: {meta['gaps']} gaps, {rows} rows")
+            results[sym] = {"gaps_filled": meta.gaps, "rows_sunk": rows}
+            print(f"  {sym}: {meta.gaps} gaps, {rows} rows")
         else:
             err = str(meta) if meta else "unknown error"
             results[sym] = {"gaps_filled": 0, "rows_sunk": 0, "error": err}
             print(f"  {sym}: FAILED — {err}")
+    results = {sym: results[sym] for sym in sym_list}
 
     # Step 3: Health check — verify DuckLake data quality for each symbol.
     # Sequential subflow calls (DuckDB reads are fast; no bottleneck).
@@ -362,7 +369,7 @@ def bulk_backfill(
 @flow(
     name="Download",
     log_prints=True,
-    task_runner=ThreadPoolTaskRunner(),
+    task_runner=ThreadPoolTaskRunner(max_workers=settings.prefect_max_workers),
 )
 def download_flow(
     trade_type: str,
@@ -385,7 +392,7 @@ def download_flow(
 @flow(
     name="Verify",
     log_prints=True,
-    task_runner=ThreadPoolTaskRunner(),
+    task_runner=ThreadPoolTaskRunner(max_workers=settings.prefect_max_workers),
 )
 def verify_flow(
     trade_type: str,
@@ -429,14 +436,23 @@ def sink_flow(
     archive_home: Path | None = None,
     catalog_path: Path | None = None,
 ) -> int:
-    """Sink to DuckLake. Wraps SinkWorkflow with Prefect."""
-    tt = TradeType(trade_type)
+    """Sink to DuckLake. Wraps SinkWorkflow with Prefect.
+
+    All symbols go through a single SinkWorkflow pass, so they land in one
+    DuckLake transaction instead of one per symbol.
+    """
+    if not symbols:
+        return 0
     home = archive_home or _DEFAULT_ARCHIVE_HOME
-    catalog = catalog_path or home.parent / "lake"
-    total = 0
-    for sym in symbols:
-        total += sink_silver(tt, sym, data_type, interval, home, catalog)
-    return total
+    return sink_silver(
+        TradeType(trade_type),
+        symbols[0],
+        data_type,
+        interval,
+        archive_home=home,
+        catalog_path=catalog_path or home.parent / "lake",
+        symbols=list(symbols),
+    )
 
 
 @flow(name="Refresh Metadata", log_prints=True)
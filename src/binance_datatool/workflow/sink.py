@@ -8,10 +8,11 @@ partitioned Parquet, and loads into DuckDB/Iceberg.
 from __future__ import annotations
 
 import csv
+import re
 import time
 import zipfile
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
@@ -22,7 +23,7 @@ from binance_datatool.lineage import LineageEvent, LineageEventType
 from binance_datatool.workflow.catalog import DuckLakeCatalog
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Collection, Sequence
 
     from binance_datatool.common import DataType, TradeType
     from binance_datatool.lineage import LineageTracker
@@ -165,7 +166,10 @@ _FULL_SILVER_FUNDING_SCHEMA = {
 }
 
 
-@dataclass
+_BRONZE_DATE_PATTERN = re.compile(r".*?-(\d{4}-\d{2}-\d{2})(?:\.zip|\.csv)")
+
+
+@dataclass(slots=True)
 class SinkStats:
     """Statistics from a sink operation."""
 
@@ -173,6 +177,7 @@ class SinkStats:
     row_count: int = 0
     symbols: int = 0
     errors: list[str] = field(default_factory=list)
+    errors_by_symbol: dict[str, list[str]] = field(default_factory=dict)
 
 
 def _scan_bronze_files(
@@ -188,12 +193,8 @@ def _scan_bronze_files(
     When ``lookback_days`` is set, only files whose date falls within
     the last N days are included (based on YYYY-MM-DD in filename).
     """
-    import re
-    from datetime import UTC, datetime, timedelta
-
     files: list[Path] = []
     data_freq = "monthly" if data_type == "fundingRate" else "daily"
-    date_pattern = re.compile(r".*?-(\d{4}-\d{2}-\d{2})(?:\.zip|\.csv)")
     date_cutoff = (
         datetime.now(UTC) - timedelta(days=lookback_days) if lookback_days is not None else None
     )
@@ -207,7 +208,7 @@ def _scan_bronze_files(
         for entry in sorted(base.iterdir()):
             if entry.suffix in (".zip", ".csv"):
                 if date_cutoff is not None:
-                    m = date_pattern.match(entry.name)
+                    m = _BRONZE_DATE_PATTERN.match(entry.name)
                     if m:
                         fdate = datetime.strptime(m.group(1), "%Y-%m-%d").replace(tzinfo=UTC)
                         if fdate < date_cutoff:
@@ -232,51 +233,54 @@ def _read_zip_csv(
     Most Binance archive CSVs have no header row — the first line is data.
     ``fundingRate`` is an exception and has a header row.
     Uses the provided ``bronze_cols`` schema, or falls back to the first
-    data line for backward compatibility.
+    data line for backward compatibility. Parsing is done by Polars' native
+    CSV reader; every column is read as a string and cast in the transform.
     """
     with zipfile.ZipFile(path) as z:
         csv_files = [n for n in z.namelist() if n.endswith(".csv")]
         if not csv_files:
             return pl.DataFrame()
         with z.open(csv_files[0]) as f:
-            content = f.read().decode("utf-8")
-    lines = content.strip().split("\n")
-    if len(lines) < 1:
+            content = f.read().strip()
+    if not content:
         return pl.DataFrame()
-    start = 1 if skip_header else 0
-    schema = bronze_cols or _parse_csv_line(lines[0])
-    rows = [_parse_csv_line(line) for line in lines[start:]]
-    return pl.DataFrame(rows, schema=schema, orient="row")
+    schema = bronze_cols or _parse_csv_line(content.split(b"\n", 1)[0].decode("utf-8"))
+    if skip_header and b"\n" not in content:
+        # Header-only file: no data rows, and read_csv rejects it as empty.
+        return pl.DataFrame(schema=dict.fromkeys(schema, pl.String))
+    return pl.read_csv(
+        content,
+        has_header=False,
+        skip_rows=1 if skip_header else 0,
+        new_columns=schema,
+        infer_schema=False,
+    )
 
 
 def _read_filled_csv(path: Path) -> pl.DataFrame:
     """Read a filled CSV file."""
-    content = path.read_text().strip()
-    lines = content.split("\n")
-    if len(lines) < 2:
+    content = path.read_bytes().strip()
+    if b"\n" not in content:
         return pl.DataFrame()
-    header = _parse_csv_line(lines[0])
-    rows = [_parse_csv_line(line) for line in lines[1:]]
-    return pl.DataFrame(rows, schema=header, orient="row")
+    return pl.read_csv(content, infer_schema=False)
 
 
 def _cast_columns(df: pl.DataFrame, schema: dict[str, pl.DataType]) -> pl.DataFrame:
     """Cast DataFrame columns to match target schema types."""
-    casts = {}
-    for col, dtype in schema.items():
-        if col in df.columns:
-            casts[col] = pl.col(col).cast(dtype, strict=False)
+    present = set(df.columns)
+    casts = [
+        pl.col(col).cast(dtype, strict=False) for col, dtype in schema.items() if col in present
+    ]
     if casts:
-        df = df.with_columns(list(casts.values()))
+        df = df.with_columns(casts)
     return df
 
 
 def _rename_to_silver(df: pl.DataFrame, mapping: dict[str, str]) -> pl.DataFrame:
     """Rename Bronze columns to Silver naming."""
-    for old, new in mapping.items():
-        if old in df.columns:
-            df = df.rename({old: new})
-    return df
+    present = set(df.columns)
+    renames = {old: new for old, new in mapping.items() if old in present}
+    return df.rename(renames) if renames else df
 
 
 def _exchange_for(trade_type: str) -> str:
@@ -301,8 +305,8 @@ def _add_silver_metadata(
     """Add Silver metadata columns."""
     now_us = int(time.time() * 1_000_000)
     exchange = _exchange_for(trade_type)
-    df = df.with_columns(pl.lit(now_us).alias("ts_recv"))
-    df = df.with_columns(
+    exprs = [
+        pl.lit(now_us).alias("ts_recv"),
         pl.lit(source).alias("source"),
         pl.lit(exchange).alias("exchange"),
         pl.lit(trade_type).alias("trade_type"),
@@ -310,13 +314,13 @@ def _add_silver_metadata(
         pl.lit(interval or "").alias("interval"),
         pl.lit(data_type).alias("data_type"),
         pl.lit(now_us).alias("ingested_at"),
-    )
+    ]
     # Compute ts_date from ts_event (μs → date) — all transforms produce ts_event
     if "ts_event" in df.columns:
-        df = df.with_columns(
+        exprs.append(
             pl.from_epoch(pl.col("ts_event") // 1_000_000, time_unit="s").dt.date().alias("ts_date")
         )
-    return df
+    return df.with_columns(exprs)
 
 
 def _normalize_to_microseconds(df: pl.DataFrame) -> pl.DataFrame:
@@ -374,25 +378,28 @@ def _bronze_agg_trades_to_silver(df: pl.DataFrame, source: str) -> pl.DataFrame:
     # Archive CSV has "True"/"False" (str); filled CSV has "1"/"0" (str)
     # is_buyer_maker=1/True → buyer is maker → seller is taker → side="sell"
     # is_buyer_maker=0/False → seller is maker → buyer is taker → side="buy"
-    df = df.with_columns(
-        pl.when(pl.col("is_buyer_maker").cast(pl.Utf8).str.to_lowercase() == "true")
+    is_buyer_maker_str = pl.col("is_buyer_maker").cast(pl.Utf8).str.to_lowercase()
+    is_buyer_maker = (
+        pl.when(is_buyer_maker_str == "true")
         .then(pl.lit(1, pl.Int64))
-        .when(pl.col("is_buyer_maker").cast(pl.Utf8).str.to_lowercase() == "false")
+        .when(is_buyer_maker_str == "false")
         .then(pl.lit(0, pl.Int64))
         .otherwise(pl.col("is_buyer_maker").cast(pl.Int64, strict=False))
-        .alias("is_buyer_maker")
     )
+    # Single projection: Polars evaluates the shared is_buyer_maker
+    # sub-expression once for both output columns.
     df = df.with_columns(
-        pl.when(pl.col("is_buyer_maker") == 1)
+        is_buyer_maker.alias("is_buyer_maker"),
+        pl.when(is_buyer_maker == 1)
         .then(pl.lit("sell"))
-        .when(pl.col("is_buyer_maker") == 0)
+        .when(is_buyer_maker == 0)
         .then(pl.lit("buy"))
         .otherwise(pl.lit(None, pl.Utf8))
         .alias("side"),
+        # preserve original agg_trade_id (archive has it; renamed to trade_id above)
+        pl.col("trade_id").alias("agg_trade_id"),
+        pl.lit("agg").alias("rtype"),
     )
-    # preserve original agg_trade_id (archive has it; renamed to trade_id above)
-    df = df.with_columns(pl.col("trade_id").alias("agg_trade_id"))
-    df = df.with_columns(pl.lit("agg").alias("rtype"))
     df = _cast_columns(df, _FULL_SILVER_AGGT_SCHEMA)
     return df
 
@@ -420,13 +427,13 @@ def _bronze_trades_to_silver(df: pl.DataFrame, source: str) -> pl.DataFrame:
         pl.when(pl.col("price").cast(pl.Float64, strict=False).is_null())
         .then(pl.lit(None, pl.Utf8))
         .otherwise(pl.lit("trade"))
-        .alias("rtype")
+        .alias("rtype"),
+        # Remove is_buyer_marker-based side derivation for now — raw trades
+        # have the same pattern but we need to add is_buyer_maker to keep
+        pl.lit(None, pl.Int64).alias("is_buyer_maker"),
+        pl.lit(None, pl.Utf8).alias("side"),
+        pl.lit(None, pl.Int64).alias("agg_trade_id"),
     )
-    # Remove is_buyer_marker-based side derivation for now — raw trades
-    # have the same pattern but we need to add is_buyer_maker to keep
-    df = df.with_columns(pl.lit(None, pl.Int64).alias("is_buyer_maker"))
-    df = df.with_columns(pl.lit(None, pl.Utf8).alias("side"))
-    df = df.with_columns(pl.lit(None, pl.Int64).alias("agg_trade_id"))
     df = _cast_columns(df, _FULL_SILVER_AGGT_SCHEMA)
     return df
 
@@ -460,28 +467,37 @@ def _bronze_funding_rate_to_silver(df: pl.DataFrame, source: str) -> pl.DataFram
     return df
 
 
+_SILVER_TRANSFORMS: dict[str, Callable[[pl.DataFrame, str], pl.DataFrame]] = {
+    "klines": _bronze_kline_to_silver,
+    "aggTrades": _bronze_agg_trades_to_silver,
+    "trades": _bronze_trades_to_silver,
+    "fundingRate": _bronze_funding_rate_to_silver,
+}
+
+
 def _bronze_to_silver(
     df: pl.DataFrame,
     data_type: str,
     source: str,
 ) -> pl.DataFrame:
     """Dispatch Bronze→Silver transform by data type."""
-    if data_type == "klines":
-        return _bronze_kline_to_silver(df, source)
-    if data_type in ("aggTrades",):
-        return _bronze_agg_trades_to_silver(df, source)
-    if data_type in ("trades",):
-        return _bronze_trades_to_silver(df, source)
-    if data_type == "fundingRate":
-        return _bronze_funding_rate_to_silver(df, source)
-    msg = f"Unknown data type: {data_type}"
-    raise ValueError(msg)
-
-
-def _parse_symbol_from_path(path: Path, known_symbols: Sequence[str]) -> str | None:
+    transform = _SILVER_TRANSFORMS.get(data_type)
+    if transform is None:
+        msg = f"Unknown data type: {data_type}"
+        raise ValueError(msg)
+    return transform(df, source)
+
+
+def _parse_symbol_from_path(path: Path, known_symbols: Collection[str]) -> str | None:
     name = path.name
+    # Archive file names start with "<symbol>-", so the text before the first
+    # dash is a direct lookup; only symbols that themselves contain a dash
+    # need the prefix scan.
+    head = name.partition("-")[0]
+    if head in known_symbols:
+        return head
     for sym in known_symbols:
-        if name.startswith(f"{sym}-"):
+        if "-" in sym and name.startswith(f"{sym}-"):
             return sym
     return None
 
@@ -521,26 +537,24 @@ class SinkWorkflow:
 
         seen_symbols: set[str] = set()
         all_dfs: list[pl.DataFrame] = []
+        bronze_cols = _BRONZE_COLS_BY_TYPE.get(data_type_str)
+        skip_header = data_type_str == "fundingRate"
+        known_symbols = frozenset(symbols)
 
         for path in files:
+            symbol = _parse_symbol_from_path(path, known_symbols)
+            if symbol is None:
+                continue
             try:
                 source = "api_filled" if "_filled" in str(path.parent) else "archive"
                 df = (
-                    _read_zip_csv(
-                        path,
-                        bronze_cols=_BRONZE_COLS_BY_TYPE.get(data_type_str),
-                        skip_header=data_type_str == "fundingRate",
-                    )
+                    _read_zip_csv(path, bronze_cols=bronze_cols, skip_header=skip_header)
                     if path.suffix == ".zip"
                     else _read_filled_csv(path)
                 )
                 if df.is_empty():
                     continue
 
-                symbol = _parse_symbol_from_path(path, symbols)
-                if symbol is None:
-                    continue
-
                 seen_symbols.add(symbol)
                 silver_df = _bronze_to_silver(df, data_type_str, source)
                 silver_df = _add_silver_metadata(
@@ -551,7 +565,9 @@ class SinkWorkflow:
 
             except Exception as e:
                 logger.error("Failed to transform {}: {}", path, e)
-                stats.errors.append(f"{path.name}: {e}")
+                error = f"{path.name}: {e}"
+                stats.errors.append(error)
+                stats.errors_by_symbol.setdefault(symbol, []).append(error)
 
         if not all_dfs:
             return stats
@@ -568,7 +584,11 @@ class SinkWorkflow:
         # Record lineage for each symbol
         if self._tracker:
             now = datetime.now()
-            for symbol in seen_symbols:
+            total_rows = len(combined)
+            # Shared by every event below, so keep it immutable.
+            sunk_symbols = tuple(seen_symbols)
+            message = f"Sunk {data_type_str} data to DuckLake ({total_rows} total rows)"
+            for symbol in sunk_symbols:
                 self._tracker.record(
                     LineageEvent(
                         source=f"binance_{trade_type_str}",
@@ -576,13 +596,13 @@ class SinkWorkflow:
                         event_type=LineageEventType.SUNK,
                         timestamp=now,
                         date=None,
-                        message=f"Sunk {data_type_str} data to DuckLake ({len(combined)} total rows)",
+                        message=message,
                         metadata={
                             "data_type": data_type_str,
                             "trade_type": trade_type_str,
                             "interval": interval or "",
-                            "row_count": len(combined),
-                            "symbols": list(seen_symbols),
+                            "row_count": total_rows,
+                            "symbols": sunk_symbols,
                         },
                     )
                 )
@@ -160,7 +160,9 @@ class ArchiveVerifyWorkflow:
                 description="Verify",
             ) as reporter,
             ProcessPoolExecutor(
-                max_workers=self.n_workers,
+                # Spawned workers re-import the package; never start more than
+                # there are files (per-symbol Prefect tasks often verify a few).
+                max_workers=min(self.n_workers, len(zip_paths)),
                 mp_context=multiprocessing.get_context("spawn"),
             ) as executor,
         ):
@@ -240,7 +242,9 @@ class ArchiveVerifyWorkflow:
         self._clean_orphans(diff_result)
 
         logger.info(
-            "verifying {} file(s) with {} worker(s)", len(diff_result.to_verify), self.n_workers
+            "verifying {} file(s) with {} worker(s)",
+            len(diff_result.to_verify),
+            min(self.n_workers, len(diff_result.to_verify)),
         )
         verify_results = self._verify_paths(diff_result.to_verify)
         verified, failed_details = self._apply_all_verify_results(verify_results)
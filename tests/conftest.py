@@ -80,24 +80,27 @@ class FakeArchiveClient:
 # ── Sample Archive Files ──────────────────────────────────────
 
 
+# ArchiveFile is frozen, so one shared tuple is safe; each test gets a fresh list.
+_SAMPLE_ARCHIVE_FILES: tuple[ArchiveFile, ...] = (
+    ArchiveFile(
+        key="data/futures/um/monthly/fundingRate/BTCUSDT/BTCUSDT-fundingRate-2026-03.zip",
+        size=1048,
+        last_modified=datetime(2026, 4, 1, 8, 6, 34, tzinfo=UTC),
+    ),
+    ArchiveFile(
+        key=(
+            "data/futures/um/monthly/fundingRate/BTCUSDT/BTCUSDT-fundingRate-2026-03.zip.CHECKSUM"
+        ),
+        size=105,
+        last_modified=datetime(2026, 4, 1, 8, 6, 34, tzinfo=UTC),
+    ),
+)
+
+
 @pytest.fixture
 def sample_archive_files() -> list[ArchiveFile]:
     """Return representative archive files for list-files tests."""
-    return [
-        ArchiveFile(
-            key="data/futures/um/monthly/fundingRate/BTCUSDT/BTCUSDT-fundingRate-2026-03.zip",
-            size=1048,
-            last_modified=datetime(2026, 4, 1, 8, 6, 34, tzinfo=UTC),
-        ),
-        ArchiveFile(
-            key=(
-                "data/futures/um/monthly/fundingRate/BTCUSDT/"
-                "BTCUSDT-fundingRate-2026-03.zip.CHECKSUM"
-            ),
-            size=105,
-            last_modified=datetime(2026, 4, 1, 8, 6, 34, tzinfo=UTC),
-        ),
-    ]
+    return list(_SAMPLE_ARCHIVE_FILES)
 
 
 # ── Trade Type Fixtures ───────────────────────────────────────
@@ -360,6 +360,102 @@ async def test_archive_client_list_symbol_files_batch_propagates_cancelled_error
         )
 
 
+@pytest.mark.asyncio
+async def test_archive_client_list_symbol_files_batch_bounds_concurrency(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Batch listings should keep at most ``max_concurrency`` requests in flight."""
+    client = ArchiveClient(max_concurrency=2)
+    in_flight = 0
+    peak = 0
+
+    class FakeSession:
+        async def __aenter__(self) -> object:
+            return object()
+
+        async def __aexit__(self, exc_type, exc, tb) -> None:
+            return None
+
+    async def fake_list_symbol_files(
+        trade_type: TradeType,
+        data_freq: DataFrequency,
+        data_type: DataType,
+        symbol: str,
+        interval: str | None = None,
+        *,
+        session: object | None = None,
+    ) -> list[ArchiveFile]:
+        nonlocal in_flight, peak
+        del trade_type, data_freq, data_type, symbol, interval, session
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return []
+
+    monkeypatch.setattr(client, "_create_session", lambda: FakeSession())
+    monkeypatch.setattr(client, "list_symbol_files", fake_list_symbol_files)
+
+    symbols = [f"SYM{i}USDT" for i in range(6)]
+    result = await client.list_symbol_files_batch(
+        TradeType.um,
+        DataFrequency.monthly,
+        DataType.funding_rate,
+        symbols,
+    )
+
+    assert list(result) == symbols
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_archive_client_list_symbol_files_batch_cancels_siblings_on_cancellation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A cancelled listing should cancel in-flight sibling listings before returning."""
+    client = ArchiveClient()
+    sibling_cancelled = asyncio.Event()
+
+    class FakeSession:
+        async def __aenter__(self) -> object:
+            return object()
+
+        async def __aexit__(self, exc_type, exc, tb) -> None:
+            return None
+
+    async def fake_list_symbol_files(
+        trade_type: TradeType,
+        data_freq: DataFrequency,
+        data_type: DataType,
+        symbol: str,
+        interval: str | None = None,
+        *,
+        session: object | None = None,
+    ) -> list[ArchiveFile]:
+        del trade_type, data_freq, data_type, interval, session
+        if symbol == "BTCUSDT":
+            raise asyncio.CancelledError()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            sibling_cancelled.set()
+            raise
+        return []
+
+    monkeypatch.setattr(client, "_create_session", lambda: FakeSession())
+    monkeypatch.setattr(client, "list_symbol_files", fake_list_symbol_files)
+
+    with pytest.raises(asyncio.CancelledError):
+        await client.list_symbol_files_batch(
+            TradeType.um,
+            DataFrequency.monthly,
+            DataType.funding_rate,
+            ["ETHUSDT", "BTCUSDT"],
+        )
+
+    assert sibling_cancelled.is_set()
+
+
 @pytest.mark.asyncio
 async def test_archive_client_list_symbol_files_batch_returns_empty_dict_for_no_symbols() -> None:
     """Empty input should short-circuit without creating a session."""
@@ -0,0 +1,50 @@
+"""Tests for DuckLake catalog helpers."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+import duckdb
+import polars as pl
+
+from binance_datatool.workflow.catalog import DuckLakeCatalog
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_ingest_dataframe_replaces_existing_symbol_dates(tmp_path: Path) -> None:
+    # A plain DuckDB table stands in for the DuckLake one: ensure_table is a
+    # no-op once the table exists, so only the dedup + insert path runs.
+    con = duckdb.connect(":memory:")
+    con.execute(f"CREATE TABLE fundingRate ({DuckLakeCatalog.TABLE_DEFS['fundingRate']})")
+    catalog = DuckLakeCatalog(lake_path=tmp_path)
+    df = pl.DataFrame(
+        {
+            "ts_event": [1, 2, 3],
+            "funding_rate": [0.1, 0.2, 0.3],
+            "symbol": ["BTCUSDT", "BTCUSDT", "ETHUSDT"],
+            "ts_date": [date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 1)],
+        }
+    )
+    catalog.ingest_dataframe(con, "fundingRate", df)
+
+    update = pl.DataFrame(
+        {
+            "ts_event": [4],
+            "funding_rate": [0.9],
+            "symbol": ["BTCUSDT"],
+            "ts_date": [date(2026, 1, 1)],
+        }
+    )
+    assert catalog.ingest_dataframe(con, "fundingRate", update) == 1
+
+    rows = con.execute(
+        "SELECT symbol, ts_date, funding_rate FROM fundingRate ORDER BY symbol, ts_date"
+    ).fetchall()
+    assert rows == [
+        ("BTCUSDT", date(2026, 1, 1), 0.9),
+        ("BTCUSDT", date(2026, 1, 2), 0.2),
+        ("ETHUSDT", date(2026, 1, 1), 0.3),
+    ]
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from types import SimpleNamespace
+
 import pytest
 
 from binance_datatool.common.enums import TradeType
@@ -99,6 +103,64 @@ class TestBinanceRestClients:
             assert hasattr(client, "stream_ohlcv")
             assert hasattr(client, "close")
 
+    async def test_sdk_call_runs_off_event_loop_thread(self) -> None:
+        calls: list[tuple[dict, int]] = []
+
+        class _Response:
+            def data(self) -> list:
+                return [{"a": 1}]
+
+        class _RestApi:
+            def compressed_aggregate_trades_list(self, **params: object) -> _Response:
+                calls.append((params, threading.get_ident()))
+                return _Response()
+
+        client = BinanceUmRestClient()
+        client._client = SimpleNamespace(rest_api=_RestApi())
+
+        result = await client.fetch_agg_trades("btcusdt", since=1, until=2)
+
+        assert result == [{"a": 1}]
+        assert calls[0][0] == {"symbol": "BTCUSDT", "start_time": 1, "end_time": 2}
+        assert calls[0][1] != threading.get_ident()
+
+    async def test_sdk_calls_are_capped_across_event_loops(self) -> None:
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+        release = threading.Event()
+
+        class _Response:
+            def data(self) -> list:
+                return []
+
+        class _RestApi:
+            def compressed_aggregate_trades_list(self, **params: object) -> _Response:
+                nonlocal in_flight, peak
+                with lock:
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                release.wait(timeout=0.05)
+                with lock:
+                    in_flight -= 1
+                return _Response()
+
+        client = BinanceUmRestClient()
+        client._client = SimpleNamespace(rest_api=_RestApi())
+        client._slots = threading.BoundedSemaphore(2)
+
+        async def _burst() -> None:
+            await asyncio.gather(*(client.fetch_agg_trades("btcusdt") for _ in range(4)))
+
+        # A second event loop in another thread shares the same client, like a
+        # parallel Prefect task would.
+        other = threading.Thread(target=asyncio.run, args=(_burst(),))
+        other.start()
+        await _burst()
+        other.join()
+
+        assert peak == 2
+
 
 class TestBinanceWsClients:
     """Test WebSocket client configuration and SDK initialization."""
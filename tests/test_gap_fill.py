@@ -0,0 +1,149 @@
+"""Tests for the REST gap-fill workflow."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from binance_datatool.common import TradeType
+from binance_datatool.workflow.gap_fill import GapFillWorkflow, _scan_existing_dates
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class FakeAggTradesClient:
+    """Exchange client double whose fetches must overlap to complete."""
+
+    trade_type = TradeType.um
+
+    def __init__(self, expected_in_flight: int, fail_symbols: set[str]) -> None:
+        self._expected = expected_in_flight
+        self._fail_symbols = fail_symbols
+        self._in_flight = 0
+        self._all_started = asyncio.Event()
+
+    async def fetch_agg_trades(
+        self,
+        symbol: str,
+        since: int | None = None,
+        until: int | None = None,
+    ) -> list[dict]:
+        self._in_flight += 1
+        if self._in_flight == self._expected:
+            self._all_started.set()
+        await asyncio.wait_for(self._all_started.wait(), timeout=1)
+        if symbol in self._fail_symbols:
+            raise RuntimeError(f"boom {symbol}")
+        return [{"a": 1, "p": "100.0", "q": "1", "f": 1, "l": 1, "T": since, "m": True}]
+
+
+async def test_run_fetches_gaps_concurrently_and_isolates_failures(tmp_path: Path) -> None:
+    client = FakeAggTradesClient(expected_in_flight=3, fail_symbols={"ETHUSDT"})
+    workflow = GapFillWorkflow(
+        exchange_client=client,
+        archive_home=tmp_path,
+        symbols=["BTCUSDT", "ETHUSDT", "SOLUSDT"],
+        data_type="aggTrades",
+    )
+
+    result = await workflow.run(start_time=1_000, end_time=2_000)
+
+    assert [p.name for p in result.filled] == [
+        "BTCUSDT-aggTrades-filled.csv",
+        "SOLUSDT-aggTrades-filled.csv",
+    ]
+    assert result.failed == [("ETHUSDT", "boom ETHUSDT")]
+    for path in result.filled:
+        assert path.with_suffix(".csv.CHECKSUM").exists()
+
+
+class PeakTrackingClient:
+    """Exchange client double that records the peak number of in-flight fetches."""
+
+    trade_type = TradeType.um
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    async def fetch_agg_trades(
+        self,
+        symbol: str,
+        since: int | None = None,
+        until: int | None = None,
+    ) -> list[dict]:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        for _ in range(3):
+            await asyncio.sleep(0)
+        self.in_flight -= 1
+        return []
+
+
+async def test_run_caps_in_flight_fetches(tmp_path: Path) -> None:
+    client = PeakTrackingClient()
+    workflow = GapFillWorkflow(
+        exchange_client=client,
+        archive_home=tmp_path,
+        symbols=[f"SYM{i}USDT" for i in range(6)],
+        data_type="aggTrades",
+        max_concurrency=2,
+    )
+
+    await workflow.run(start_time=1_000, end_time=2_000)
+
+    assert client.peak == 2
+
+
+class SlowFirstClient:
+    """Exchange client double whose first symbol stalls while the rest return."""
+
+    trade_type = TradeType.um
+
+    def __init__(self, slow_symbol: str) -> None:
+        self._slow_symbol = slow_symbol
+        self.started: list[str] = []
+        self.started_while_slow: int | None = None
+
+    async def fetch_agg_trades(
+        self,
+        symbol: str,
+        since: int | None = None,
+        until: int | None = None,
+    ) -> list[dict]:
+        self.started.append(symbol)
+        if symbol == self._slow_symbol:
+            for _ in range(10):
+                await asyncio.sleep(0)
+            self.started_while_slow = len(self.started)
+        return [{"a": 1, "p": "100.0", "q": "1", "f": 1, "l": 1, "T": since, "m": True}]
+
+
+async def test_run_bounds_unpersisted_gaps_behind_a_slow_one(tmp_path: Path) -> None:
+    symbols = [f"SYM{i}USDT" for i in range(6)]
+    client = SlowFirstClient(slow_symbol=symbols[0])
+    workflow = GapFillWorkflow(
+        exchange_client=client,
+        archive_home=tmp_path,
+        symbols=symbols,
+        data_type="aggTrades",
+        max_concurrency=2,
+    )
+
+    result = await workflow.run(start_time=1_000, end_time=2_000)
+
+    assert client.started_while_slow == 2
+    assert [p.name for p in result.filled] == [f"{s}-aggTrades-filled.csv" for s in symbols]
+
+
+def test_scan_existing_dates_recurses_and_skips_filled(tmp_path: Path) -> None:
+    (tmp_path / "1h").mkdir()
+    (tmp_path / "1h" / "BTCUSDT-1h-2026-01-02.zip").touch()
+    (tmp_path / "BTCUSDT-1h-2026-01-01.zip").touch()
+    (tmp_path / "BTCUSDT-1h-2026-01-01.zip.CHECKSUM").touch()
+    (tmp_path / "_filled").mkdir()
+    (tmp_path / "_filled" / "BTCUSDT-1h-2026-01-03.csv").touch()
+
+    assert _scan_existing_dates(tmp_path) == {"2026-01-01", "2026-01-02"}
+    assert _scan_existing_dates(tmp_path / "missing") == set()
@@ -231,3 +231,36 @@ def test_check_anomaly_count_correct(mem_con: duckdb.DuckDBPyConnection) -> None
     report = check_ducklake_anomalies(mem_con, "klines", "BTCUSDT")
     assert report.null_prices == 2  # open=0 in row1, high=0 in row2
     assert report.zero_volumes == 1  # volume=0 in row2
+
+
+def test_check_detects_date_gaps(mem_con: duckdb.DuckDBPyConnection) -> None:
+    _create_kline_table(
+        mem_con,
+        [
+            ("BTCUSDT", 1, "2026-01-01", 100.0, 101.0, 99.0, 100.5, 1000.0),
+            ("BTCUSDT", 2, "2026-01-02", 101.0, 102.0, 100.0, 101.5, 1100.0),
+            ("BTCUSDT", 3, "2026-01-05", 102.0, 103.0, 101.0, 102.5, 1200.0),
+        ],
+    )
+    report = check_ducklake_anomalies(mem_con, "klines", "BTCUSDT")
+    assert report.date_gaps == ["2026-01-03", "2026-01-04"]
+
+
+def test_check_skips_outlier_query_without_close_column(
+    mem_con: duckdb.DuckDBPyConnection,
+) -> None:
+    """Trade tables have no close column, so the outlier query must not run."""
+    mem_con.execute(
+        "CREATE TABLE aggTrades (symbol VARCHAR, ts_event BIGINT, ts_date VARCHAR, price DOUBLE)"
+    )
+    mem_con.execute("INSERT INTO aggTrades VALUES ('BTCUSDT', 1, '2026-01-01', 100.0)")
+    queries: list[str] = []
+
+    class RecordingCon:
+        def execute(self, query: str, params: list | None = None):
+            queries.append(query)
+            return mem_con.execute(query, params)
+
+    report = check_ducklake_anomalies(RecordingCon(), "aggTrades", "BTCUSDT")
+    assert report.is_clean
+    assert not any("STDDEV" in q for q in queries)
@@ -1,8 +1,21 @@
 """Tests for sink workflow — TDD spec: docs/specs-driven-development.md"""
 
+import zipfile
 from pathlib import Path
 
-from binance_datatool.workflow.sink import _parse_symbol_from_path
+import polars as pl
+import pytest
+
+from binance_datatool.common import DataType, TradeType
+from binance_datatool.workflow.sink import (
+    SinkWorkflow,
+    _add_silver_metadata,
+    _bronze_agg_trades_to_silver,
+    _bronze_to_silver,
+    _parse_symbol_from_path,
+    _read_filled_csv,
+    _read_zip_csv,
+)
 
 
 def test_parse_symbol_exact_match() -> None:
@@ -48,6 +61,12 @@ def test_parse_symbol_filled_csv_path() -> None:
     assert result == "BTCUSDT"
 
 
+def test_parse_symbol_with_dash_in_symbol() -> None:
+    path = Path("BTC-260327-100000-C-BVOLIndex-2026-01-01.zip")
+    result = _parse_symbol_from_path(path, frozenset({"ETHUSDT", "BTC-260327-100000-C"}))
+    assert result == "BTC-260327-100000-C"
+
+
 def test_parse_symbol_substring_not_matched() -> None:
     """'USDT' must NOT match 'BTCUSDT-1h.zip' — only startswith should match."""
     path = Path("BTCUSDT-1h-2026-01-01.zip")
@@ -67,3 +86,99 @@ def test_parse_symbol_nested_path() -> None:
     path = Path("/data/spot/daily/klines/BTCUSDT/1h/BTCUSDT-1h-2026-01-01.zip")
     result = _parse_symbol_from_path(path, ["BTCUSDT"])
     assert result == "BTCUSDT"
+
+
+def test_agg_trades_side_from_is_buyer_maker() -> None:
+    """Archive "True"/"False" and filled "1"/"0" flags map to taker side."""
+    df = pl.DataFrame(
+        {
+            "agg_trade_id": ["1", "2", "3", "4"],
+            "price": ["100.0", "100.5", "101.0", "99.5"],
+            "quantity": ["1", "2", "3", "4"],
+            "transact_time": ["1704067200000"] * 4,
+            "is_buyer_maker": ["True", "false", "1", "0"],
+        }
+    )
+    out = _bronze_agg_trades_to_silver(df, "archive")
+    assert out["is_buyer_maker"].to_list() == [1, 0, 1, 0]
+    assert out["side"].to_list() == ["sell", "buy", "sell", "buy"]
+    assert out["agg_trade_id"].to_list() == [1, 2, 3, 4]
+    assert out["rtype"].to_list() == ["agg"] * 4
+    assert out["ts_event"].to_list() == [1_704_067_200_000_000] * 4
+
+
+def test_add_silver_metadata_columns() -> None:
+    df = pl.DataFrame({"ts_event": [1_704_067_200_000_000]})
+    out = _add_silver_metadata(df, "um", "klines", "BTCUSDT", "1h", "archive")
+    row = out.row(0, named=True)
+    assert row["exchange"] == "binance-futures"
+    assert row["symbol"] == "BTCUSDT"
+    assert row["interval"] == "1h"
+    assert row["ts_recv"] == row["ingested_at"]
+    assert str(row["ts_date"]) == "2024-01-01"
+
+
+def test_read_zip_csv_parses_all_rows(tmp_path: Path) -> None:
+    path = tmp_path / "BTCUSDT-fundingRate-2024-01.zip"
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr(
+            "BTCUSDT-fundingRate-2024-01.csv",
+            "calc_time,funding_interval_hours,last_funding_rate\r\n"
+            "1704067200000,8,0.0001\r\n"
+            '1704096000000,8,"-0.0002"\r\n',
+        )
+    cols = ["calc_time", "funding_interval_hours", "last_funding_rate"]
+    df = _read_zip_csv(path, bronze_cols=cols, skip_header=True)
+    assert df.columns == cols
+    assert df.rows() == [
+        ("1704067200000", "8", "0.0001"),
+        ("1704096000000", "8", "-0.0002"),
+    ]
+
+
+def test_read_zip_csv_header_only_is_empty(tmp_path: Path) -> None:
+    path = tmp_path / "BTCUSDT-fundingRate-2024-02.zip"
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr(
+            "BTCUSDT-fundingRate-2024-02.csv",
+            "calc_time,funding_interval_hours,last_funding_rate\r\n",
+        )
+    cols = ["calc_time", "funding_interval_hours", "last_funding_rate"]
+    df = _read_zip_csv(path, bronze_cols=cols, skip_header=True)
+    assert df.is_empty()
+    assert df.columns == cols
+
+
+def test_read_filled_csv_uses_header_and_keeps_strings(tmp_path: Path) -> None:
+    path = tmp_path / "BTCUSDT-aggTrades-filled.csv"
+    path.write_text("agg_trade_id,price,is_buyer_maker\n1,100.5,True\n2,101.0,False\n")
+    df = _read_filled_csv(path)
+    assert df.columns == ["agg_trade_id", "price", "is_buyer_maker"]
+    assert df.rows() == [("1", "100.5", "True"), ("2", "101.0", "False")]
+
+    path.write_text("agg_trade_id,price,is_buyer_maker\n")
+    assert _read_filled_csv(path).is_empty()
+
+
+def test_bronze_to_silver_rejects_unknown_data_type() -> None:
+    with pytest.raises(ValueError, match="Unknown data type: bookTicker"):
+        _bronze_to_silver(pl.DataFrame(), "bookTicker", "archive")
+
+
+def test_transform_records_errors_by_symbol(tmp_path: Path) -> None:
+    base = tmp_path / "data" / TradeType.um.s3_path / "daily" / "aggTrades"
+    for symbol in ("BTCUSDT", "ETHUSDT"):
+        (base / symbol).mkdir(parents=True)
+        (base / symbol / f"{symbol}-aggTrades-2024-01-01.zip").write_bytes(b"not a zip")
+    (base / "BTCUSDT" / "BTCUSDT-aggTrades-2024-01-02.zip").write_bytes(b"not a zip")
+
+    stats = SinkWorkflow(archive_home=tmp_path).transform(
+        trade_type=TradeType.um,
+        data_type=DataType.agg_trades,
+        symbols=["BTCUSDT", "ETHUSDT"],
+    )
+
+    assert len(stats.errors) == 3
+    assert sorted(stats.errors_by_symbol) == ["BTCUSDT", "ETHUSDT"]
+    assert len(stats.errors_by_symbol["BTCUSDT"]) == 2
+    assert stats.errors_by_symbol["ETHUSDT"][0].startswith("ETHUSDT-aggTrades-2024-01-01.zip:")